@@ -1,24 +1,32 @@
 """Main entry point for cloud billing pipelines."""
 
+import logging
+import queue
 import sys
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from logging.handlers import QueueHandler, QueueListener
 
 import dlt
 
 from pipelines.aws_cur import aws_billing_source
 from pipelines.azure_billing import azure_billing_source
 
+logger = logging.getLogger(__name__)
+
 # Registry of available pipelines
-# Format: 'name': (source_function, pipeline_name, description)
+# Format: 'name': (source_function, pipeline_name, description, config_section)
 PIPELINES = {
     "aws": (
         aws_billing_source,
         "aws_billing_pipeline",
         "AWS Cost and Usage Report pipeline",
+        "aws_cur",
     ),
     "azure": (
         azure_billing_source,
         "azure_billing_pipeline",
         "Azure billing FOCUS export pipeline",
+        "azure_billing",
     ),
 }
 
@@ -37,21 +45,18 @@ def run_pipeline(name: str) -> None:
         available = ", ".join(PIPELINES.keys())
         raise ValueError(f"Unknown pipeline '{name}'. Available: {available}, all")
 
-    source_func, pipeline_name, description = PIPELINES[name]
+    source_func, pipeline_name, description, config_section = PIPELINES[name]
 
-    print(f"\n{'=' * 60}")
-    print(f"Starting: {description}")
-    print(f"Pipeline: {pipeline_name}")
-    print(f"{'=' * 60}\n")
+    logger.info("%s", "=" * 60)
+    logger.info("Starting: %s", description)
+    logger.info("Pipeline: %s", pipeline_name)
+    logger.info("%s", "=" * 60)
 
     # Create source - DLT auto-injects config from sources.{module_name}
     source = source_func()
 
     # Get dataset name from source config using explicit path
     # e.g., sources.aws_cur.dataset or sources.azure_billing.dataset
-    config_section = name if name != "aws" else "aws_cur"
-    if name == "azure":
-        config_section = "azure_billing"
     dataset_name = dlt.config[f"sources.{config_section}.dataset"]
 
     # Create pipeline with BigQuery destination
@@ -64,30 +69,63 @@ def run_pipeline(name: str) -> None:
     # Run the pipeline
     load_info = pipeline.run(source)
 
-    print(f"\n{'=' * 60}")
-    print(f"Completed: {description}")
-    print(f"Load info: {load_info}")
-    print(f"{'=' * 60}\n")
+    logger.info("%s", "=" * 60)
+    logger.info("Completed: %s", description)
+    logger.info("Load info: %s", load_info)
+    logger.info("%s", "=" * 60)
 
 
 def run_all_pipelines() -> None:
-    """Run all registered billing pipelines sequentially."""
-    print(f"\nRunning all {len(PIPELINES)} billing pipelines...\n")
+    """
+    Run all registered billing pipelines concurrently.
+
+    Pipelines touch disjoint GCS paths and BigQuery datasets, so they run in
+    parallel and wall-clock time is that of the slowest pipeline.
+    """
+    logger.info("Running all %d billing pipelines...", len(PIPELINES))
 
     failed = []
-    for name in PIPELINES:
-        try:
-            run_pipeline(name)
-        except Exception as e:
-            print(f"\n❌ Pipeline '{name}' failed: {e}\n")
-            failed.append(name)
-            # Continue with other pipelines instead of stopping
+    with ThreadPoolExecutor(max_workers=len(PIPELINES)) as executor:
+        futures = {executor.submit(run_pipeline, name): name for name in PIPELINES}
+        for future in as_completed(futures):
+            name = futures[future]
+            try:
+                future.result()
+            except Exception as e:
+                logger.error("❌ Pipeline '%s' failed: %s", name, e)
+                failed.append(name)
+                # Continue with other pipelines instead of stopping
 
     if failed:
-        print(f"\n⚠️  {len(failed)} pipeline(s) failed: {', '.join(failed)}")
+        logger.error("⚠️  %d pipeline(s) failed: %s", len(failed), ", ".join(failed))
         sys.exit(1)
     else:
-        print(f"\n✅ All {len(PIPELINES)} pipelines completed successfully!")
+        logger.info("✅ All %d pipelines completed successfully!", len(PIPELINES))
+
+
+def configure_logging() -> QueueListener:
+    """
+    Route log records through a queue so worker threads never block on stdout.
+
+    Pipelines run concurrently, so records are handed to a QueueHandler and
+    written to stdout by a single QueueListener thread.
+
+    Returns:
+        Started QueueListener (call stop() to flush before exit)
+    """
+    log_queue = queue.SimpleQueue()
+    stream_handler = logging.StreamHandler(sys.stdout)
+    stream_handler.setFormatter(logging.Formatter("%(asctime)s %(name)s %(message)s"))
+
+    # The queue side must not add a prefix: QueueHandler.prepare() bakes its
+    # formatted message into record.msg, and the listener formats it again
+    queue_handler = QueueHandler(log_queue)
+    queue_handler.setFormatter(logging.Formatter("%(message)s"))
+
+    logging.basicConfig(level=logging.INFO, handlers=[queue_handler])
+    listener = QueueListener(log_queue, stream_handler)
+    listener.start()
+    return listener
 
 
 def main():
@@ -105,6 +143,7 @@ def main():
     else:
         pipeline_name = "all"
 
+    listener = configure_logging()
     try:
         if pipeline_name == "all":
             run_all_pipelines()
@@ -115,13 +154,15 @@ def main():
         print("Usage:")
         print("  python main.py [pipeline_name]")
         print("\nAvailable pipelines:")
-        for name, (_, _, description) in PIPELINES.items():
+        for name, (_, _, description, _) in PIPELINES.items():
             print(f"  {name:10s} - {description}")
         print(f"  {'all':10s} - Run all pipelines (default)")
         sys.exit(1)
     except Exception as e:
-        print(f"\n❌ Pipeline execution failed: {e}")
+        logger.error("❌ Pipeline execution failed: %s", e)
         raise
+    finally:
+        listener.stop()
 
 
 if __name__ == "__main__":
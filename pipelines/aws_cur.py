@@ -1,15 +1,20 @@
 """AWS Cost and Usage Report (CUR) pipeline to BigQuery."""
 
+import logging
 import re
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timezone
+from functools import lru_cache
 from typing import Iterator
 
 import dlt
 from google.cloud import bigquery
 
-from pipelines.common.bigquery import PartitionManager
+from pipelines.common.bigquery import PartitionManager, get_bigquery_client
 from pipelines.common.manifest import AWSManifest, ManifestDiscovery
 
+logger = logging.getLogger(__name__)
+
 # AWS CUR type mapping to BigQuery types
 AWS_TO_BIGQUERY_TYPES = {
     "String": "STRING",
@@ -21,10 +26,18 @@ AWS_TO_BIGQUERY_TYPES = {
 }
 
 # SQL reserved words that need suffix
-SQL_RESERVED_WORDS = {
+SQL_RESERVED_WORDS = frozenset({
     "group", "order", "user", "table", "index", "key", "value", "timestamp",
     "date", "year", "month", "day", "hour", "minute", "second", "from", "to",
-}
+})
+
+# Precompiled patterns for column name normalization
+_CAMEL_RE = re.compile(r'([a-z0-9])([A-Z])')
+_NONALNUM_RE = re.compile(r'[^a-z0-9]')
+_MULTI_US_RE = re.compile(r'_+')
+
+# Max tracking records per list yielded to DLT
+TRACKING_BATCH_SIZE = 50
 
 
 @dlt.source
@@ -35,6 +48,12 @@ def aws_billing_source(
     table_name: str = dlt.config.value,
     project_id: str = dlt.config.value,
     dataset: str = dlt.config.value,
+    max_workers: int = 8,
+    discovery_workers: int = 16,
+    use_wildcard_uris: bool = False,
+    since: str | None = None,
+    until: str | None = None,
+    limit: int | None = None,
 ):
     """
     AWS billing data source.
@@ -52,6 +71,12 @@ def aws_billing_source(
         table_name: BigQuery table name
         project_id: BigQuery project ID
         dataset: BigQuery dataset
+        max_workers: Max BigQuery load jobs in flight at once
+        discovery_workers: Max concurrent GCS list requests during manifest discovery
+        use_wildcard_uris: Load per-directory wildcard URIs instead of every file
+        since: Earliest billing month to load, inclusive (YYYY-MM, default: all)
+        until: Latest billing month to load, inclusive (YYYY-MM, default: all)
+        limit: Only consider the newest N billing months (default: all)
 
     Yields:
         DLT resources for state tracking
@@ -63,7 +88,20 @@ def aws_billing_source(
         name=f"{table_name}_load_tracking",
         write_disposition="append",
     )
-    return resource_func(bucket, prefix, export_name, table_name, project_id, dataset)
+    return resource_func(
+        bucket,
+        prefix,
+        export_name,
+        table_name,
+        project_id,
+        dataset,
+        max_workers,
+        discovery_workers,
+        use_wildcard_uris,
+        since,
+        until,
+        limit,
+    )
 
 
 def aws_billing_resource(
@@ -73,7 +111,13 @@ def aws_billing_resource(
     table_name: str,
     project_id: str,
     dataset: str,
-) -> Iterator[dict]:
+    max_workers: int = 8,
+    discovery_workers: int = 16,
+    use_wildcard_uris: bool = False,
+    since: str | None = None,
+    until: str | None = None,
+    limit: int | None = None,
+) -> Iterator[list[dict]]:
     """
     Load AWS billing data using BigQuery native LOAD from GCS.
 
@@ -81,6 +125,9 @@ def aws_billing_resource(
     Auto-detects format (CSV or Parquet) from manifest contentType field.
     BigQuery loads files directly from GCS URIs (zero data copying).
 
+    Eligible months load concurrently in a pool of max_workers threads, so
+    wall-clock time on backfills is well below the sum of the months.
+
     Args:
         bucket: GCS bucket name
         prefix: GCS prefix path
@@ -88,13 +135,20 @@ def aws_billing_resource(
         table_name: BigQuery table name (actual billing data table)
         project_id: BigQuery project ID
         dataset: BigQuery dataset name
+        max_workers: Max BigQuery load jobs in flight at once
+        discovery_workers: Max concurrent GCS list requests during manifest discovery
+        use_wildcard_uris: Load per-directory wildcard URIs instead of every file
+        since: Earliest billing month to load, inclusive (YYYY-MM, default: all)
+        until: Latest billing month to load, inclusive (YYYY-MM, default: all)
+        limit: Only consider the newest N billing months (default: all)
 
     Yields:
-        Minimal tracking records for DLT state management
+        Batches of minimal tracking records for DLT state management
     """
     # Access DLT state for this resource
     state = dlt.current.resource_state()
     loaded_executions = state.setdefault("loaded_executions", {})
+    loaded_pairs = _loaded_pairs(loaded_executions)
 
     # Track run statistics for data quality monitoring
     run_stats = {
@@ -103,134 +157,247 @@ def aws_billing_resource(
         "manifests_skipped": 0,
     }
 
-    # Discover manifests (newest first)
-    discovery = ManifestDiscovery(bucket)
-    manifests = list(discovery.discover_aws_manifests(prefix, export_name))
-
-    print(f"Discovered {len(manifests)} AWS CUR manifests")
-
-    # Initialize BigQuery client and partition manager
-    bq_client = bigquery.Client(project=project_id)
-    partition_manager = PartitionManager(project_id, dataset)
-
-    for manifest in manifests:
+    # Collect every manifest to load before touching BigQuery: all target months
+    # are cleared before the first load is submitted, so discovery must finish first
+    # (manifest downloads still run in parallel inside discovery)
+    discovery = ManifestDiscovery(bucket, max_workers=discovery_workers)
+    manifests_seen = 0
+    to_load = []
+
+    for manifest in discovery.discover_aws_manifests(
+        prefix, export_name, since, until, limit
+    ):
+        manifests_seen += 1
         billing_month = manifest.billing_month
         assembly_id = manifest.assembly_id
 
         # Check if already loaded (DLT state check)
-        # New state structure: {"2025-10": {"assembly_id": "...", "loaded_at": "..."}}
-        # Old state structure: {"2025-10": ["assembly_id1", "assembly_id2", ...]}
+        if (billing_month, assembly_id) in loaded_pairs:
+            logger.info("Skipping %s (assembly_id: %s) - already loaded", billing_month, assembly_id)
+            run_stats["manifests_skipped"] += 1
+            continue
         if billing_month in loaded_executions:
-            existing_entry = loaded_executions[billing_month]
-
-            # Handle backward compatibility with old list-based state
-            if isinstance(existing_entry, list):
-                # Old format: check if assembly_id is in the list
-                if assembly_id in existing_entry:
-                    print(f"Skipping {billing_month} (assembly_id: {assembly_id}) - already loaded")
-                    run_stats["manifests_skipped"] += 1
-                    continue
-                else:
-                    print(f"Found newer manifest for {billing_month} (assembly_id: {assembly_id}), will reload")
-            else:
-                # New format: dict with assembly_id and loaded_at
-                if existing_entry["assembly_id"] == assembly_id:
-                    print(f"Skipping {billing_month} (assembly_id: {assembly_id}) - already loaded")
-                    run_stats["manifests_skipped"] += 1
-                    continue
-                else:
-                    print(f"Found newer manifest for {billing_month} (assembly_id: {assembly_id}), will reload")
-
-        print(f"Processing {billing_month} (assembly_id: {assembly_id})")
-
-        # Delete existing partition before loading
-        partition_date = f"{billing_month}-01"
-        partition_manager.delete_partition(
-            table_name, "bill_billing_period_start_date", partition_date
-        )
-
-        # Auto-detect format from manifest contentType
-        is_parquet = manifest.content_type == "Parquet"
-
-        if is_parquet:
-            # Parquet format: build URIs and config for Parquet files
-            gcs_uris = _build_parquet_gcs_uris(bucket, manifest)
-            print(f"  Loading {len(gcs_uris)} Parquet files from GCS...")
-            for uri in gcs_uris[:5]:  # Show first 5
-                print(f"    {uri}")
-            if len(gcs_uris) > 5:
-                print(f"    ... and {len(gcs_uris) - 5} more")
-            job_config = _build_parquet_job_config()
-        else:
-            # CSV format: build URIs, schema, and config for CSV files
-            gcs_uris = _build_csv_gcs_uris(bucket, manifest)
-            print(f"  Loading {len(gcs_uris)} CSV files from GCS...")
-            for uri in gcs_uris:
-                print(f"    {uri}")
-            schema = _build_bigquery_schema(manifest)
-            job_config = _build_csv_job_config(schema)
-
-        # Load directly from GCS URIs (no data download!)
-        table_id = f"{project_id}.{dataset}.{table_name}"
-        load_job = bq_client.load_table_from_uri(
-            gcs_uris,
-            table_id,
-            job_config=job_config,
-        )
+            logger.info(
+                "Found newer manifest for %s (assembly_id: %s), will reload",
+                billing_month,
+                assembly_id,
+            )
 
-        # Wait for load to complete
-        load_job.result()
+        to_load.append(manifest)
 
-        print(f"  Loaded {load_job.output_rows} rows to {table_name}")
+    logger.info("Discovered %d AWS CUR manifests", manifests_seen)
 
-        # Mark as loaded in DLT state (hybrid approach: track assembly_id + timestamp)
-        loaded_executions[billing_month] = {
-            "assembly_id": assembly_id,
-            "loaded_at": datetime.now(timezone.utc).isoformat(),
-        }
+    table_id = f"{project_id}.{dataset}.{table_name}"
 
-        print(f"Completed loading {billing_month} (assembly_id: {assembly_id})")
+    if to_load:
+        bq_client = get_bigquery_client(project_id)
+        partition_manager = PartitionManager(project_id, dataset, client=bq_client)
 
-        # Update run statistics
-        run_stats["total_rows"] += load_job.output_rows
-        run_stats["manifests_processed"] += 1
+        # Clear every target month before any load is submitted (full-month
+        # replacement), so no delete can race a load into the same table
+        partition_manager.clear_partitions(
+            table_name,
+            "bill_billing_period_start_date",
+            [f"{manifest.billing_month}-01" for manifest in to_load],
+        )
 
-        # Yield minimal tracking record (DLT will persist state after run completes)
-        yield {
-            "assembly_id": assembly_id,
-            "billing_month": billing_month,
-            "loaded_at": datetime.now(timezone.utc),
-            "row_count": load_job.output_rows,
-            "file_count": len(gcs_uris),
-            "format": "parquet" if is_parquet else "csv",
+    # Tracking records are yielded to DLT in batches to amortize per-item overhead
+    batch = []
+
+    # Each worker submits one month's load and waits for it, so at most
+    # max_workers loads are in flight at any time
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {
+            executor.submit(
+                _load_month, bq_client, bucket, manifest, table_id, use_wildcard_uris
+            ): manifest
+            for manifest in to_load
         }
+        for future in as_completed(futures):
+            manifest = futures[future]
+            billing_month = manifest.billing_month
+            assembly_id = manifest.assembly_id
+
+            # Surface any load error
+            load_job, meta = future.result()
+            loaded_at = datetime.now(timezone.utc)
+
+            logger.info("  Loaded %d rows to %s (%s)", load_job.output_rows, table_name, billing_month)
+
+            # Mark as loaded in DLT state (hybrid approach: track assembly_id + timestamp)
+            loaded_executions[billing_month] = {
+                "assembly_id": assembly_id,
+                "loaded_at": loaded_at.isoformat(),
+            }
+
+            logger.info("Completed loading %s (assembly_id: %s)", billing_month, assembly_id)
+
+            # Update run statistics
+            run_stats["total_rows"] += load_job.output_rows
+            run_stats["manifests_processed"] += 1
+
+            # Batch minimal tracking records (DLT will persist state after run completes)
+            batch.append({
+                "assembly_id": assembly_id,
+                "billing_month": billing_month,
+                "loaded_at": loaded_at,
+                "row_count": load_job.output_rows,
+                "file_count": meta["file_count"],
+                "format": meta["format"],
+            })
+            if len(batch) >= TRACKING_BATCH_SIZE:
+                yield batch
+                batch = []
 
     # Always yield a run summary record for data quality monitoring
     # This ensures we have a record even when all manifests are skipped (0 rows loaded)
     run_date = datetime.now(timezone.utc).date().isoformat()
-    yield {
+    batch.append({
         "run_date": run_date,
         "total_rows": run_stats["total_rows"],
         "manifests_processed": run_stats["manifests_processed"],
         "manifests_skipped": run_stats["manifests_skipped"],
         "is_run_summary": True,
         "loaded_at": datetime.now(timezone.utc),
+    })
+    yield batch
+
+    logger.info(
+        "Run summary: %d rows loaded, %d processed, %d skipped",
+        run_stats["total_rows"],
+        run_stats["manifests_processed"],
+        run_stats["manifests_skipped"],
+    )
+
+
+def _loaded_pairs(loaded_executions: dict) -> set[tuple[str, str]]:
+    """
+    Flatten loaded_executions state into (billing_month, assembly_id) pairs.
+
+    New state structure: {"2025-10": {"assembly_id": "...", "loaded_at": "..."}}
+    Old state structure: {"2025-10": ["assembly_id1", "assembly_id2", ...]}
+
+    Args:
+        loaded_executions: DLT state mapping billing month to loaded execution(s)
+
+    Returns:
+        Set of (billing_month, assembly_id) pairs already loaded
+    """
+    loaded_pairs = set()
+    for billing_month, entry in loaded_executions.items():
+        # Handle backward compatibility with old list-based state
+        if isinstance(entry, list):
+            loaded_pairs.update((billing_month, assembly_id) for assembly_id in entry)
+        else:
+            loaded_pairs.add((billing_month, entry["assembly_id"]))
+    return loaded_pairs
+
+
+def _load_month(
+    bq_client: bigquery.Client,
+    bucket: str,
+    manifest: AWSManifest,
+    table_id: str,
+    use_wildcard_uris: bool = False,
+) -> tuple[bigquery.LoadJob, dict]:
+    """
+    Load one billing month and wait for the job to finish.
+
+    Args:
+        bq_client: BigQuery client
+        bucket: GCS bucket name
+        manifest: AWS manifest object for the billing month
+        table_id: Fully qualified destination table ID
+        use_wildcard_uris: Collapse per-file URIs into per-directory wildcards
+
+    Returns:
+        Tuple of (finished load_job, metadata dict with file_count and format)
+    """
+    logger.info(
+        "Processing %s (assembly_id: %s)",
+        manifest.billing_month,
+        manifest.assembly_id,
+    )
+    load_job, meta = _submit_month(bq_client, bucket, manifest, table_id, use_wildcard_uris)
+    load_job.result()
+    return load_job, meta
+
+
+def _submit_month(
+    bq_client: bigquery.Client,
+    bucket: str,
+    manifest: AWSManifest,
+    table_id: str,
+    use_wildcard_uris: bool = False,
+) -> tuple[bigquery.LoadJob, dict]:
+    """
+    Submit a BigQuery LOAD job for one billing month without waiting on it.
+
+    Auto-detects format (CSV or Parquet) from manifest contentType field.
+
+    Args:
+        bq_client: BigQuery client
+        bucket: GCS bucket name
+        manifest: AWS manifest object for the billing month
+        table_id: Fully qualified destination table ID
+        use_wildcard_uris: Collapse per-file URIs into per-directory wildcards
+
+    Returns:
+        Tuple of (load_job, metadata dict with file_count and format)
+    """
+    # Auto-detect format from manifest contentType
+    is_parquet = manifest.content_type == "Parquet"
+
+    if is_parquet:
+        # Parquet format: build URIs and config for Parquet files
+        gcs_uris = _build_parquet_gcs_uris(bucket, manifest)
+        logger.info("  Loading %d Parquet files from GCS...", len(gcs_uris))
+        _log_uris(gcs_uris)
+        job_config = _build_parquet_job_config()
+    else:
+        # CSV format: build URIs, schema, and config for CSV files
+        gcs_uris = _build_csv_gcs_uris(bucket, manifest)
+        logger.info("  Loading %d CSV files from GCS...", len(gcs_uris))
+        _log_uris(gcs_uris)
+        schema = _build_bigquery_schema(manifest)
+        job_config = _build_csv_job_config(schema)
+
+    # Let BigQuery expand directories server-side instead of sending every file
+    load_uris = _build_wildcard_gcs_uris(gcs_uris) if use_wildcard_uris else gcs_uris
+
+    # Load directly from GCS URIs (no data download!)
+    load_job = bq_client.load_table_from_uri(
+        load_uris,
+        table_id,
+        job_config=job_config,
+    )
+
+    meta = {
+        "file_count": len(gcs_uris),
+        "format": "parquet" if is_parquet else "csv",
     }
+    return load_job, meta
 
-    print(f"\nRun summary: {run_stats['total_rows']} rows loaded, "
-          f"{run_stats['manifests_processed']} processed, "
-          f"{run_stats['manifests_skipped']} skipped")
 
+def _log_uris(uris: list[str], preview: int = 5) -> None:
+    """Log the first few URIs plus a summary line as a single record."""
+    lines = [f"    {uri}" for uri in uris[:preview]]
+    if len(uris) > preview:
+        lines.append(f"    ... and {len(uris) - preview} more")
+    if lines:
+        logger.info("\n".join(lines))
 
+
+@lru_cache(maxsize=4096)
 def _normalize_column_name(column_name: str) -> str:
     """Normalize AWS CUR column name to BigQuery-compatible format."""
     # Convert camelCase to snake_case
-    name = re.sub(r'([a-z0-9])([A-Z])', r'\1_\2', column_name)
+    name = _CAMEL_RE.sub(r'\1_\2', column_name)
     # Lowercase and replace non-alphanumeric with underscore
     name = name.lower()
-    name = re.sub(r'[^a-z0-9]', '_', name)
+    name = _NONALNUM_RE.sub('_', name)
     # Remove consecutive underscores and strip edges
-    name = re.sub(r'_+', '_', name).strip('_')
+    name = _MULTI_US_RE.sub('_', name).strip('_')
     # Handle edge cases
     if not name:
         return "unknown_column"
@@ -243,15 +410,13 @@ def _normalize_column_name(column_name: str) -> str:
 
 def _resolve_duplicate_names(column_names: list[str]) -> list[str]:
     """Resolve duplicate column names by appending numeric suffixes."""
-    seen = {}
-    resolved = []
-    for name in column_names:
-        if name not in seen:
-            seen[name] = 0
-            resolved.append(name)
-        else:
-            seen[name] += 1
-            resolved.append(f"{name}_{seen[name]}")
+    counts = {}
+    resolved = [None] * len(column_names)
+    for i, name in enumerate(column_names):
+        # First occurrence stays unsuffixed, later ones get _1, _2, ...
+        count = counts.get(name, -1) + 1
+        counts[name] = count
+        resolved[i] = name if count == 0 else f"{name}_{count}"
     return resolved
 
 
@@ -276,27 +441,12 @@ def _build_csv_gcs_uris(bucket: str, manifest: AWSManifest) -> list[str]:
     # manifest_path format: gcs-transfer/aws_doit/CUR/account/YYYYMMDD-YYYYMMDD/account-Manifest.json
     manifest_dir = "/".join(manifest.manifest_path.split("/")[:-1])
 
-    uris = []
-    for file_key in manifest.report_keys:
-        # reportKey format: CUR/account/YYYYMMDD-YYYYMMDD/assemblyId/file.csv.gz
-        # We need to extract the path after the date range to get: assemblyId/file.csv.gz
-
-        # Find the versioned subdirectory and filename (everything after the date range)
-        # Split by "/" and take the last 2 parts (assemblyId/filename)
-        parts = file_key.split("/")
-        if len(parts) >= 2:
-            # Take last 2 parts: assemblyId and filename
-            relative_path = "/".join(parts[-2:])
-        else:
-            # Fallback: just use the filename
-            relative_path = parts[-1]
-
-        # Construct actual GCS path
-        gcs_path = f"{manifest_dir}/{relative_path}"
-        uri = f"gs://{bucket}/{gcs_path}"
-        uris.append(uri)
-
-    return uris
+    # reportKey format: CUR/account/YYYYMMDD-YYYYMMDD/assemblyId/file.csv.gz
+    # We need the path after the date range: assemblyId/file.csv.gz (last 2 parts)
+    return [
+        f"gs://{bucket}/{manifest_dir}/{relative_path}"
+        for relative_path in _relative_report_paths(manifest.report_keys, 2)
+    ]
 
 
 def _build_parquet_gcs_uris(bucket: str, manifest: AWSManifest) -> list[str]:
@@ -322,22 +472,86 @@ def _build_parquet_gcs_uris(bucket: str, manifest: AWSManifest) -> list[str]:
     # Remove the last 2 parts (date-range dir and manifest filename) to get prefix
     prefix_dir = "/".join(manifest_parts[:-2])
 
-    uris = []
-    for file_key in manifest.report_keys:
-        # reportKey format: billing/aws-billing-cur/plotly_cur_export_2025/plotly_cur_export_2025/year=2025/month=11/file.snappy.parquet
-        # We need: {export}/year=YYYY/month=MM/filename (last 4 parts)
+    # reportKey format: billing/aws-billing-cur/plotly_cur_export_2025/plotly_cur_export_2025/year=2025/month=11/file.snappy.parquet
+    # We need: {export}/year=YYYY/month=MM/filename (last 4 parts)
+    return [
+        f"gs://{bucket}/{prefix_dir}/{relative_path}"
+        for relative_path in _relative_report_paths(manifest.report_keys, 4)
+    ]
+
+
+def _relative_report_paths(report_keys: list[str], segments: int) -> list[str]:
+    """
+    Take the last N path segments of each report key.
+
+    Report keys in one manifest share the same leading segments, so the length
+    of that leading prefix is measured once and later keys are simply sliced.
+    Keys that don't fit the measured structure fall back to split/join.
+
+    Args:
+        report_keys: Report keys from the AWS manifest
+        segments: Number of trailing path segments to keep
+
+    Returns:
+        Relative paths (falls back to just the filename for short keys)
+    """
+    paths = []
+    leading = None
+    for file_key in report_keys:
+        # Fast path: same leading prefix and same number of trailing segments
+        if (
+            leading is not None
+            and file_key.startswith(leading)
+            and file_key.count("/", len(leading)) == segments - 1
+        ):
+            paths.append(file_key[len(leading):])
+            continue
+
         parts = file_key.split("/")
-        if len(parts) >= 4:
-            # Take last 4 parts: export_name/year=YYYY/month=MM/filename
-            relative_path = "/".join(parts[-4:])
+        if len(parts) >= segments:
+            relative_path = "/".join(parts[-segments:])
         else:
             # Fallback: just use the filename
             relative_path = parts[-1]
 
-        # Construct actual GCS path
-        gcs_path = f"{prefix_dir}/{relative_path}"
-        uri = f"gs://{bucket}/{gcs_path}"
-        uris.append(uri)
+        # Measure the prefix to strip for subsequent keys
+        leading = file_key[: len(file_key) - len(relative_path)]
+        paths.append(relative_path)
+
+    return paths
+
+
+def _build_wildcard_gcs_uris(gcs_uris: list[str]) -> list[str]:
+    """
+    Collapse per-file GCS URIs into one wildcard URI per directory.
+
+    Each wildcard keeps the shared file extension (e.g. "*.csv.gz") so that
+    versioned manifest JSON files sitting next to the data are never matched.
+    Directories whose files don't share an extension keep their explicit URIs.
+
+    Only safe when each directory holds just the files for the current manifest,
+    which is why this is opt-in via the use_wildcard_uris config flag.
+
+    Args:
+        gcs_uris: Per-file GCS URIs (gs://bucket/path/file.ext)
+
+    Returns:
+        List of GCS URIs with wildcards where possible
+    """
+    # Group files by directory, preserving first-seen order
+    by_dir: dict[str, list[str]] = {}
+    for uri in gcs_uris:
+        directory, _, filename = uri.rpartition("/")
+        by_dir.setdefault(directory, []).append(filename)
+
+    uris = []
+    for directory, filenames in by_dir.items():
+        extensions = {name.partition(".")[2] for name in filenames}
+        if len(extensions) == 1 and (extension := extensions.pop()):
+            uris.append(f"{directory}/*.{extension}")
+        else:
+            # Mixed or missing extensions: selective inclusion needs explicit URIs
+            uris.extend(f"{directory}/{name}" for name in filenames)
 
     return uris
 
@@ -359,6 +573,7 @@ def _build_csv_job_config(schema: list[bigquery.SchemaField]) -> bigquery.LoadJo
         schema_update_options=[
             bigquery.SchemaUpdateOption.ALLOW_FIELD_ADDITION,
         ],
+        autodetect=False,  # Explicit schema from the manifest
         skip_leading_rows=1,  # Skip CSV header row
         allow_jagged_rows=False,
         allow_quoted_newlines=True,
@@ -400,7 +615,8 @@ def _build_bigquery_schema(manifest: AWSManifest) -> list[bigquery.SchemaField]:
     Build BigQuery schema from AWS CUR manifest.
 
     Applies column name normalization and duplicate resolution to match
-    what BigQuery will see in the CSV headers.
+    what BigQuery will see in the CSV headers. Schemas are cached by column
+    set, so months with an unchanged layout reuse the same schema.
 
     Args:
         manifest: AWS manifest object with column definitions
@@ -408,34 +624,37 @@ def _build_bigquery_schema(manifest: AWSManifest) -> list[bigquery.SchemaField]:
     Returns:
         List of BigQuery SchemaField objects
     """
-    # First pass: collect original column names and types
-    original_names = []
-    types_map = {}
+    # Column order is kept in the key - CSV columns are matched by position
+    columns_key = tuple(
+        (col["category"], col["name"], col["type"]) for col in manifest.columns
+    )
+    return list(_schema_for(columns_key))
 
-    for col in manifest.columns:
-        # AWS CUR column names are formatted as "category/name"
-        col_name = f"{col['category']}/{col['name']}"
-        original_names.append(col_name)
-        aws_type = col["type"]
-        bq_type = AWS_TO_BIGQUERY_TYPES.get(aws_type, "STRING")
-        types_map[col_name] = bq_type
-
-    # Second pass: normalize column names and resolve duplicates
-    normalized = [_normalize_column_name(name) for name in original_names]
-    unique_names = _resolve_duplicate_names(normalized)
-
-    # Third pass: build schema with normalized names
-    schema = []
-    for i, original_name in enumerate(original_names):
-        normalized_name = unique_names[i]
-        bq_type = types_map[original_name]
-
-        schema.append(
-            bigquery.SchemaField(
-                name=normalized_name,
-                field_type=bq_type,
-                mode="NULLABLE",
-            )
-        )
 
-    return schema
+@lru_cache(maxsize=64)
+def _schema_for(
+    columns_key: tuple[tuple[str, str, str], ...],
+) -> tuple[bigquery.SchemaField, ...]:
+    """
+    Build a BigQuery schema from (category, name, type) column tuples.
+
+    Args:
+        columns_key: Manifest columns as hashable (category, name, type) tuples
+
+    Returns:
+        Tuple of BigQuery SchemaField objects
+    """
+    # Single pass: normalize names and map types side by side
+    normalized_names = []
+    bq_types = []
+    for category, name, aws_type in columns_key:
+        # AWS CUR column names are formatted as "category/name"
+        normalized_names.append(_normalize_column_name(f"{category}/{name}"))
+        bq_types.append(AWS_TO_BIGQUERY_TYPES.get(aws_type, "STRING"))
+
+    # Resolve duplicates once, then build schema with normalized names
+    unique_names = _resolve_duplicate_names(normalized_names)
+    return tuple(
+        bigquery.SchemaField(name=name, field_type=bq_type, mode="NULLABLE")
+        for name, bq_type in zip(unique_names, bq_types)
+    )
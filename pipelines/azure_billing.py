@@ -1,14 +1,36 @@
 """Azure billing pipeline to BigQuery."""
 
+import logging
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timezone
 from typing import Iterator
 
 import dlt
 from google.cloud import bigquery
 
-from pipelines.common.bigquery import PartitionManager
+from pipelines.common.bigquery import PartitionManager, get_bigquery_client
 from pipelines.common.manifest import AzureManifest, ManifestDiscovery
 
+logger = logging.getLogger(__name__)
+
+# Load decimals as NUMERIC where they fit, BIGNUMERIC only where required.
+# BigQuery picks the narrowest listed type that fits each column's precision
+# and scale: NUMERIC (scale <= 9) takes half the storage of BIGNUMERIC,
+# while decimal128(38,18) cost fields still map to BIGNUMERIC
+DECIMAL_TARGET_TYPES = [
+    bigquery.DecimalTargetType.NUMERIC,
+    bigquery.DecimalTargetType.BIGNUMERIC,
+]
+
+# Azure FOCUS tables are partitioned by month on BillingPeriodStart
+PARTITION_COLUMN = "billingperiodstart"
+
+# Clustering applied when the pipeline creates the table
+DEFAULT_CLUSTERING_FIELDS = ["servicename", "subaccountid", "chargeperiodstart"]
+
+# Name of the temporary external table over a manifest's Parquet files
+_SOURCE_TABLE = "billing_files"
+
 
 @dlt.source
 def azure_billing_source(
@@ -18,6 +40,10 @@ def azure_billing_source(
     table_name: str = dlt.config.value,
     project_id: str = dlt.config.value,
     dataset: str = dlt.config.value,
+    max_workers: int = 8,
+    cache_manifest_metadata: bool = False,
+    columns: list[str] | None = None,
+    clustering_fields: list[str] | None = None,
 ):
     """
     Azure billing data source.
@@ -35,6 +61,13 @@ def azure_billing_source(
         table_name: BigQuery table name
         project_id: BigQuery project ID
         dataset: BigQuery dataset
+        max_workers: Max BigQuery load jobs in flight at once
+        cache_manifest_metadata: Cache manifest fields in GCS object metadata so
+            already-loaded manifests are not re-downloaded on later runs
+        columns: Optional allow-list of Parquet columns to keep (default: all);
+            loads then run as billed queries instead of free load jobs
+        clustering_fields: Clustering columns used when the table is first created
+            (default: DEFAULT_CLUSTERING_FIELDS, [] for none)
 
     Yields:
         DLT resources for state tracking
@@ -46,7 +79,18 @@ def azure_billing_source(
         name=f"{table_name}_load_tracking",
         write_disposition="append",
     )
-    return resource_func(bucket, prefix, export_name, table_name, project_id, dataset)
+    return resource_func(
+        bucket,
+        prefix,
+        export_name,
+        table_name,
+        project_id,
+        dataset,
+        max_workers,
+        cache_manifest_metadata,
+        columns,
+        clustering_fields,
+    )
 
 
 def azure_billing_resource(
@@ -56,12 +100,26 @@ def azure_billing_resource(
     table_name: str,
     project_id: str,
     dataset: str,
+    max_workers: int = 8,
+    cache_manifest_metadata: bool = False,
+    columns: list[str] | None = None,
+    clustering_fields: list[str] | None = None,
 ) -> Iterator[dict]:
     """
     Load Azure billing data using BigQuery native LOAD from GCS.
 
     Uses DLT state to track loaded executions and avoid duplicates.
     BigQuery loads Parquet files directly from GCS URIs (zero data copying).
+    One load job per month runs in a bounded pool of max_workers threads.
+
+    With a column allow-list, each month is instead loaded by an INSERT ... SELECT
+    over a temporary external table on the same URIs. Parquet is columnar, so
+    only the listed columns are read and stored. Unlike load jobs (free), these
+    are billed queries over the external data. The allow-list must include
+    billingperiodstart and every clustering field.
+
+    If the table does not exist yet, it is created partitioned by month on
+    billingperiodstart and clustered, so partition clears and queries can prune.
 
     Args:
         bucket: GCS bucket name
@@ -70,10 +128,25 @@ def azure_billing_resource(
         table_name: BigQuery table name (actual billing data table)
         project_id: BigQuery project ID
         dataset: BigQuery dataset name
+        max_workers: Max BigQuery load jobs in flight at once
+        cache_manifest_metadata: Cache manifest fields in GCS object metadata so
+            already-loaded manifests are not re-downloaded on later runs
+        columns: Optional allow-list of Parquet columns to keep (default: all);
+            loads then run as billed queries instead of free load jobs
+        clustering_fields: Clustering columns used when the table is first created
+            (default: DEFAULT_CLUSTERING_FIELDS, [] for none)
 
     Yields:
         Minimal tracking records for DLT state management
+
+    Raises:
+        ValueError: If columns omits the partition column or a clustering field
     """
+    if clustering_fields is None:
+        clustering_fields = DEFAULT_CLUSTERING_FIELDS
+    if columns:
+        _validate_columns(columns, clustering_fields)
+
     # Access DLT state for this resource
     state = dlt.current.resource_state()
     loaded_executions = state.setdefault("loaded_executions", {})
@@ -85,103 +158,114 @@ def azure_billing_resource(
         "manifests_skipped": 0,
     }
 
-    # Discover manifests (newest first)
-    discovery = ManifestDiscovery(bucket)
-    manifests = list(discovery.discover_azure_manifests(prefix, export_name))
+    # Run IDs already loaded per month, as sets for O(1) membership checks.
+    # State itself stays JSON-serializable:
+    # New state structure: {"2025-10": {"run_id": "...", "submitted_time": "..."}}
+    # Old state structure: {"2025-10": ["run_id1", "run_id2", ...]}
+    loaded_runs = _loaded_runs_by_month(loaded_executions)
 
-    print(f"Discovered {len(manifests)} Azure billing manifests")
+    # Discover manifests (newest first)
+    discovery = ManifestDiscovery(bucket, cache_metadata=cache_manifest_metadata)
+    manifests = list(
+        discovery.discover_azure_manifests(
+            prefix, export_name, frozenset().union(*loaded_runs.values())
+        )
+    )
 
-    # Initialize BigQuery client and partition manager
-    bq_client = bigquery.Client(project=project_id)
-    partition_manager = PartitionManager(project_id, dataset)
+    logger.info("Discovered %d Azure billing manifests", len(manifests))
 
+    # First pass: filter out manifests already loaded
+    to_load = []
     for manifest in manifests:
         billing_month = manifest.billing_month
         run_id = manifest.run_id
-        submitted_time = manifest.submitted_time
 
         # Check if already loaded (DLT state check)
-        # New state structure: {"2025-10": {"run_id": "...", "submitted_time": "..."}}
-        # Old state structure: {"2025-10": ["run_id1", "run_id2", ...]}
-        if billing_month in loaded_executions:
-            existing_entry = loaded_executions[billing_month]
-
-            # Handle backward compatibility with old list-based state
-            if isinstance(existing_entry, list):
-                # Old format: check if run_id is in the list
-                if run_id in existing_entry:
-                    print(f"Skipping {billing_month} (run_id: {run_id}) - already loaded")
-                    run_stats["manifests_skipped"] += 1
-                    continue
-                else:
-                    print(f"Found newer manifest for {billing_month} (run_id: {run_id}), will reload")
-            else:
-                # New format: dict with run_id and submitted_time
-                if existing_entry["run_id"] == run_id:
-                    print(f"Skipping {billing_month} (run_id: {run_id}) - already loaded")
-                    run_stats["manifests_skipped"] += 1
-                    continue
-                else:
-                    print(f"Found newer manifest for {billing_month} (run_id: {run_id}), will reload")
-
-        print(f"Processing {billing_month} (run_id: {run_id}, submitted: {submitted_time})")
-
-        # Delete existing partition before loading
-        # Azure FOCUS uses BillingPeriodStart column
-        partition_date = f"{billing_month}-01"
-        partition_manager.delete_partition(
-            table_name, "billingperiodstart", partition_date
-        )
+        if run_id in loaded_runs.get(billing_month, ()):
+            logger.info("Skipping %s (run_id: %s) - already loaded", billing_month, run_id)
+            run_stats["manifests_skipped"] += 1
+            continue
+        if billing_month in loaded_runs:
+            logger.info("Found newer manifest for %s (run_id: %s), will reload", billing_month, run_id)
 
-        # Build GCS URIs from manifest - handle path mismatch
-        gcs_uris = _build_gcs_uris(bucket, manifest)
+        to_load.append(manifest)
 
-        print(f"  Loading {len(gcs_uris)} Parquet files from GCS...")
-        for uri in gcs_uris:
-            print(f"    {uri}")
+    # Initialize BigQuery client and partition manager
+    bq_client = get_bigquery_client(project_id)
+    partition_manager = PartitionManager(project_id, dataset, client=bq_client)
+
+    # Clear existing partitions before loading (full-month replacement)
+    partition_manager.clear_partitions(
+        table_name,
+        PARTITION_COLUMN,
+        [f"{manifest.billing_month}-01" for manifest in to_load],
+    )
 
-        # Configure BigQuery load job
-        # Use BIGNUMERIC for decimal128 columns (required for Azure FOCUS cost fields)
-        job_config = bigquery.LoadJobConfig(
-            source_format=bigquery.SourceFormat.PARQUET,
-            write_disposition=bigquery.WriteDisposition.WRITE_APPEND,
-            # Map Parquet decimal128(38,18) to BigQuery BIGNUMERIC instead of NUMERIC
-            decimal_target_types=[bigquery.DecimalTargetType.BIGNUMERIC],
-        )
+    # Partitioning and clustering can only be set when the table is created
+    create_table = bool(to_load) and not partition_manager.table_exists(table_name)
 
-        # Load directly from GCS URIs (no data download/upload!)
-        table_id = f"{project_id}.{dataset}.{table_name}"
-        load_job = bq_client.load_table_from_uri(
-            gcs_uris,
+    table_id = f"{project_id}.{dataset}.{table_name}"
+    if columns and create_table:
+        _create_projected_table(
+            bq_client,
+            _build_gcs_uris(bucket, to_load[0]),
             table_id,
-            job_config=job_config,
+            columns,
+            clustering_fields,
         )
 
-        # Wait for load to complete
-        load_job.result()
-
-        print(f"  Loaded {load_job.output_rows} rows to {table_name}")
-
-        # Mark as loaded in DLT state (hybrid approach: track run_id + timestamp)
-        loaded_executions[billing_month] = {
-            "run_id": run_id,
-            "submitted_time": submitted_time,
-        }
-
-        print(f"Completed loading {billing_month} (run_id: {run_id})")
-
-        # Update run statistics
-        run_stats["total_rows"] += load_job.output_rows
-        run_stats["manifests_processed"] += 1
-
-        # Yield minimal tracking record (DLT will persist state after run completes)
-        yield {
-            "run_id": run_id,
-            "billing_month": billing_month,
-            "loaded_at": datetime.now(timezone.utc),
-            "row_count": load_job.output_rows,
-            "file_count": len(gcs_uris),
+    # Each worker submits one month's load and waits for it, so at most
+    # max_workers loads are in flight against the table at any time; each
+    # month is recorded as soon as its load finishes
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {
+            executor.submit(
+                _load_month,
+                bq_client,
+                bucket,
+                manifest,
+                table_id,
+                columns,
+                clustering_fields if create_table else None,
+            ): manifest
+            for manifest in to_load
         }
+        for future in as_completed(futures):
+            manifest = futures[future]
+            billing_month = manifest.billing_month
+            run_id = manifest.run_id
+            file_count = len(manifest.blobs)
+
+            # Surface any load error
+            load_job = future.result()
+            row_count = _loaded_rows(load_job)
+
+            # Mark as loaded in DLT state (hybrid approach: track run_id + timestamp)
+            loaded_executions[billing_month] = {
+                "run_id": run_id,
+                "submitted_time": manifest.submitted_time,
+            }
+
+            logger.info(
+                "Completed loading %s (run_id: %s): %d rows to %s",
+                billing_month,
+                run_id,
+                row_count,
+                table_name,
+            )
+
+            # Update run statistics
+            run_stats["total_rows"] += row_count
+            run_stats["manifests_processed"] += 1
+
+            # Yield minimal tracking record (DLT will persist state after run completes)
+            yield {
+                "run_id": run_id,
+                "billing_month": billing_month,
+                "loaded_at": datetime.now(timezone.utc),
+                "row_count": row_count,
+                "file_count": file_count,
+            }
 
     # Always yield a run summary record for data quality monitoring
     # This ensures we have a record even when all manifests are skipped (0 rows loaded)
@@ -195,9 +279,189 @@ def azure_billing_resource(
         "loaded_at": datetime.now(timezone.utc),
     }
 
-    print(f"\nRun summary: {run_stats['total_rows']} rows loaded, "
-          f"{run_stats['manifests_processed']} processed, "
-          f"{run_stats['manifests_skipped']} skipped")
+    logger.info(
+        "Run summary: %d rows loaded, %d processed, %d skipped",
+        run_stats["total_rows"],
+        run_stats["manifests_processed"],
+        run_stats["manifests_skipped"],
+    )
+
+
+def _loaded_runs_by_month(loaded_executions: dict) -> dict[str, frozenset[str]]:
+    """Map each billing month in state to its loaded run IDs (old and new formats)."""
+    loaded_runs = {}
+    for billing_month, entry in loaded_executions.items():
+        if isinstance(entry, list):
+            # Backward compatibility with old list-based state
+            loaded_runs[billing_month] = frozenset(entry)
+        else:
+            loaded_runs[billing_month] = frozenset((entry["run_id"],))
+    return loaded_runs
+
+
+def _load_month(
+    bq_client: bigquery.Client,
+    bucket: str,
+    manifest: AzureManifest,
+    table_id: str,
+    columns: list[str] | None,
+    clustering_fields: list[str] | None,
+) -> bigquery.LoadJob | bigquery.QueryJob:
+    """
+    Load one month's Parquet files and wait for the job to finish.
+
+    Args:
+        bq_client: BigQuery client
+        bucket: GCS bucket name
+        manifest: Azure manifest for the month
+        table_id: Fully qualified destination table ID
+        columns: Optional allow-list of columns to keep
+        clustering_fields: Clustering columns if the load may create the table
+
+    Returns:
+        The finished job
+    """
+    # Build GCS URIs from manifest - handle path mismatch
+    gcs_uris = _build_gcs_uris(bucket, manifest)
+
+    logger.info(
+        "Processing %s (run_id: %s, submitted: %s): loading %d Parquet files from GCS",
+        manifest.billing_month,
+        manifest.run_id,
+        manifest.submitted_time,
+        len(manifest.blobs),
+    )
+    # Only build the URI block when DEBUG is enabled
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Loading URIs:\n%s", "\n".join(gcs_uris))
+
+    # Load directly from GCS URIs (no data download/upload!)
+    load_job = _submit_load(bq_client, gcs_uris, table_id, columns, clustering_fields)
+    load_job.result()
+    return load_job
+
+
+def _build_job_config(
+    clustering_fields: list[str] | None = None,
+) -> bigquery.LoadJobConfig:
+    """
+    Build BigQuery load job config for Azure FOCUS Parquet files.
+
+    Args:
+        clustering_fields: When given, the load may create the table, so the
+            monthly partitioning and these clustering columns are set on it
+
+    Returns:
+        LoadJobConfig for Parquet format
+    """
+    job_config = bigquery.LoadJobConfig(
+        source_format=bigquery.SourceFormat.PARQUET,
+        write_disposition=bigquery.WriteDisposition.WRITE_APPEND,
+        decimal_target_types=DECIMAL_TARGET_TYPES,
+    )
+    if clustering_fields is not None:
+        job_config.time_partitioning = bigquery.TimePartitioning(
+            type_=bigquery.TimePartitioningType.MONTH,
+            field=PARTITION_COLUMN,
+        )
+        job_config.clustering_fields = clustering_fields or None
+    return job_config
+
+
+def _submit_load(
+    bq_client: bigquery.Client,
+    gcs_uris: list[str],
+    table_id: str,
+    columns: list[str] | None,
+    clustering_fields: list[str] | None = None,
+) -> bigquery.LoadJob | bigquery.QueryJob:
+    """
+    Start loading one manifest's Parquet files into the billing table.
+
+    Args:
+        bq_client: BigQuery client
+        gcs_uris: GCS URIs of the manifest's Parquet files
+        table_id: Fully qualified destination table ID
+        columns: Optional allow-list of columns to keep
+        clustering_fields: Clustering columns if the load may create the table
+
+    Returns:
+        LoadJob, or a QueryJob running INSERT ... SELECT when columns are given
+    """
+    if not columns:
+        return bq_client.load_table_from_uri(
+            gcs_uris, table_id, job_config=_build_job_config(clustering_fields)
+        )
+
+    column_list = _column_list(columns)
+    query = f"""
+    INSERT INTO `{table_id}` ({column_list})
+    SELECT {column_list} FROM {_SOURCE_TABLE}
+    """
+    return bq_client.query(query, job_config=_build_source_config(gcs_uris))
+
+
+def _create_projected_table(
+    bq_client: bigquery.Client,
+    gcs_uris: list[str],
+    table_id: str,
+    columns: list[str],
+    clustering_fields: list[str],
+) -> None:
+    """Create the partitioned billing table with only the allow-listed columns (no rows)."""
+    logger.info("Creating %s with %d allow-listed columns", table_id, len(columns))
+    cluster_by = f"CLUSTER BY {_column_list(clustering_fields)}" if clustering_fields else ""
+    query = f"""
+    CREATE TABLE IF NOT EXISTS `{table_id}`
+    PARTITION BY TIMESTAMP_TRUNC({PARTITION_COLUMN}, MONTH)
+    {cluster_by}
+    AS SELECT {_column_list(columns)} FROM {_SOURCE_TABLE} LIMIT 0
+    """
+    bq_client.query(query, job_config=_build_source_config(gcs_uris)).result()
+
+
+def _build_source_config(gcs_uris: list[str]) -> bigquery.QueryJobConfig:
+    """Build a query config exposing the Parquet files as a temporary external table."""
+    source = bigquery.ExternalConfig(bigquery.ExternalSourceFormat.PARQUET)
+    source.source_uris = gcs_uris
+    source.decimal_target_types = DECIMAL_TARGET_TYPES
+    return bigquery.QueryJobConfig(table_definitions={_SOURCE_TABLE: source})
+
+
+def _validate_columns(columns: list[str], clustering_fields: list[str]) -> None:
+    """
+    Check that a column allow-list keeps the partition and clustering columns.
+
+    Rows loaded without the partition column get NULL there and can never be
+    cleared by a month reload, and CLUSTER BY fails on columns not selected.
+    BigQuery column names are case-insensitive, so the check is too.
+
+    Raises:
+        ValueError: If a required column is missing from columns
+    """
+    selected = {column.casefold() for column in columns}
+    missing = [
+        column
+        for column in [PARTITION_COLUMN, *clustering_fields]
+        if column.casefold() not in selected
+    ]
+    if missing:
+        raise ValueError(
+            f"columns allow-list must include {', '.join(missing)} "
+            "(partition and clustering columns)"
+        )
+
+
+def _column_list(columns: list[str]) -> str:
+    """Quote column names for a SELECT/INSERT column list."""
+    return ", ".join(f"`{column}`" for column in columns)
+
+
+def _loaded_rows(job: bigquery.LoadJob | bigquery.QueryJob) -> int:
+    """Rows written by a finished load job or INSERT query."""
+    if isinstance(job, bigquery.LoadJob):
+        return job.output_rows
+    return job.num_dml_affected_rows
 
 
 def _build_gcs_uris(bucket: str, manifest: AzureManifest) -> list[str]:
@@ -212,22 +476,33 @@ def _build_gcs_uris(bucket: str, manifest: AzureManifest) -> list[str]:
 
     This handles the path mismatch by constructing URIs relative to manifest location.
 
+    Each export run writes its Parquet files into its own run directory, so when
+    every blob sits in one directory a single "*.parquet" wildcard is returned
+    and BigQuery expands it server-side.
+
     Args:
         bucket: GCS bucket name
         manifest: Azure manifest object with manifest_path and blobs
 
     Returns:
-        List of GCS URIs (gs://bucket/path/file.parquet)
+        List of GCS URIs (a single wildcard, or gs://bucket/path/file.parquet per blob)
     """
     # Get directory containing the manifest
     # manifest_path format: gcs-transfer/azure/billingdata/export-name/YYYYMMDD-YYYYMMDD/timestamp/run_id/manifest.json
-    manifest_dir = "/".join(manifest.manifest_path.split("/")[:-1])
+    manifest_dir = manifest.manifest_path.rpartition("/")[0]
+
+    # Collapse to one wildcard when all blobs are Parquet files in one directory
+    blob_names = [blob_info["blobName"] for blob_info in manifest.blobs]
+    blob_dirs = {name.rpartition("/")[0] for name in blob_names}
+    if len(blob_dirs) == 1 and all(name.endswith(".parquet") for name in blob_names):
+        return [f"gs://{bucket}/{manifest_dir}/*.parquet"]
 
+    # Fallback: blobs span directories, so list every file explicitly
     uris = []
     for blob_info in manifest.blobs:
         # blobName format: billingdata/export-name/YYYYMMDD-YYYYMMDD/timestamp/run_id/part_X_XXXX.snappy.parquet
         # Extract just the filename
-        filename = blob_info["blobName"].split("/")[-1]
+        filename = blob_info["blobName"].rpartition("/")[2]
 
         # Construct actual GCS path
         gcs_path = f"{manifest_dir}/{filename}"
@@ -1,20 +1,54 @@
 """BigQuery partition management utilities."""
 
+import logging
+from functools import lru_cache
+
+from google.api_core.exceptions import NotFound
 from google.cloud import bigquery
 
+logger = logging.getLogger(__name__)
+
+
+@lru_cache(maxsize=4)
+def get_bigquery_client(project_id: str) -> bigquery.Client:
+    """
+    Return a shared BigQuery client for a project.
+
+    Clients are cached per project so credential discovery and HTTP session
+    setup happen once per process rather than once per pipeline run.
+
+    Args:
+        project_id: GCP project ID
+
+    Returns:
+        Cached BigQuery client
+    """
+    return bigquery.Client(project=project_id)
+
+
+# Partition ID length (digits of YYYYMMDD) for each time-partitioning type
+_PARTITION_ID_LENGTHS = {
+    bigquery.TimePartitioningType.DAY: 8,
+    bigquery.TimePartitioningType.MONTH: 6,
+    bigquery.TimePartitioningType.YEAR: 4,
+}
+
 
 class PartitionManager:
     """Manage BigQuery table partitions for billing data."""
 
-    def __init__(self, project_id: str, dataset: str):
+    def __init__(
+        self, project_id: str, dataset: str, client: bigquery.Client | None = None
+    ):
         """
         Initialize partition manager.
 
         Args:
             project_id: GCP project ID
             dataset: BigQuery dataset name
+            client: Existing BigQuery client to share (defaults to the cached one)
         """
-        self.client = bigquery.Client(project=project_id)
+        self.client = client or get_bigquery_client(project_id)
         self.project_id = project_id
         self.dataset = dataset
 
@@ -37,6 +71,9 @@ class PartitionManager:
         If the DELETE covers all rows in a partition, BigQuery removes the
         entire partition without scanning bytes (free operation).
 
+        The month is matched with a parameterized range on the bare TIMESTAMP
+        partition column, which keeps partition pruning active.
+
         Args:
             table_name: Table name (without project/dataset prefix)
             partition_column: Name of the partitioning column
@@ -44,17 +81,166 @@ class PartitionManager:
         """
         # Check if table exists first
         if not self.table_exists(table_name):
-            print(f"Table {table_name} does not exist yet, skipping partition deletion")
+            logger.info("Table %s does not exist yet, skipping partition deletion", table_name)
             return
 
         query = f"""
         DELETE FROM `{self.project_id}.{self.dataset}.{table_name}`
-        WHERE DATE({partition_column}) = '{partition_value}'
+        WHERE {partition_column} >= TIMESTAMP(@partition_date)
+          AND {partition_column} < TIMESTAMP(DATE_ADD(@partition_date, INTERVAL 1 MONTH))
         """
-        print(f"Deleting partition {partition_value} from {table_name}...")
-        query_job = self.client.query(query)
-        result = query_job.result()
-        print(f"Deleted {result.total_rows} rows from partition {partition_value}")
+        logger.info("Deleting partition %s from %s...", partition_value, table_name)
+        query_job = self.client.query(
+            query, job_config=_partition_date_config(partition_value)
+        )
+        query_job.result()
+        logger.info(
+            "Deleted %s rows from partition %s",
+            query_job.num_dml_affected_rows,
+            partition_value,
+        )
+
+    def delete_partitions(
+        self, table_name: str, partition_column: str, partition_values: list[str]
+    ) -> None:
+        """
+        Delete all rows in several partitions with a single DELETE statement.
+
+        Reloading N months this way pays the query job overhead once instead
+        of N times. The range over the bare partition column keeps pruning
+        active; the month list then restricts it to exactly those months.
+
+        Args:
+            table_name: Table name (without project/dataset prefix)
+            partition_column: Name of the partitioning column
+            partition_values: Partition values (e.g., ['2025-09-01', '2025-10-01'])
+        """
+        if not partition_values:
+            return
+
+        # Check if table exists first
+        if not self.table_exists(table_name):
+            logger.info("Table %s does not exist yet, skipping partition deletion", table_name)
+            return
+
+        query = f"""
+        DELETE FROM `{self.project_id}.{self.dataset}.{table_name}`
+        WHERE {partition_column} >= TIMESTAMP(@min_date)
+          AND {partition_column} < TIMESTAMP(DATE_ADD(@max_date, INTERVAL 1 MONTH))
+          AND DATE_TRUNC(DATE({partition_column}), MONTH) IN UNNEST(@partition_dates)
+        """
+        job_config = bigquery.QueryJobConfig(
+            query_parameters=[
+                bigquery.ScalarQueryParameter("min_date", "DATE", min(partition_values)),
+                bigquery.ScalarQueryParameter("max_date", "DATE", max(partition_values)),
+                bigquery.ArrayQueryParameter("partition_dates", "DATE", partition_values),
+            ]
+        )
+        logger.info(
+            "Deleting partitions %s from %s...", ", ".join(partition_values), table_name
+        )
+        query_job = self.client.query(query, job_config=job_config)
+        query_job.result()
+        logger.info(
+            "Deleted %s rows from %d partition(s)",
+            query_job.num_dml_affected_rows,
+            len(partition_values),
+        )
+
+    def drop_partition(self, table_name: str, partition_value: str) -> None:
+        """
+        Drop a whole monthly partition via the partition decorator.
+
+        Deleting `table$YYYYMM` is a metadata-only operation: no DML job, no
+        slot time and no bytes scanned. Only valid for MONTH-partitioned tables.
+
+        Args:
+            table_name: Table name (without project/dataset prefix)
+            partition_value: Partition value (e.g., '2025-09-01' for monthly partition)
+        """
+        # Monthly partition IDs are YYYYMM
+        partition_id = partition_value.replace("-", "")[:6]
+        logger.info("Dropping partition %s from %s...", partition_id, table_name)
+        self.client.delete_table(
+            f"{self.project_id}.{self.dataset}.{table_name}${partition_id}",
+            not_found_ok=True,
+        )
+
+    def clear_partitions(
+        self, table_name: str, partition_column: str, partition_values: list[str]
+    ) -> None:
+        """
+        Remove all rows for the given months ahead of a full-month reload.
+
+        Drops each partition via its decorator when the table is MONTH-partitioned
+        on partition_column, otherwise falls back to a single DELETE statement.
+        Months whose partition is already empty are skipped entirely.
+
+        Args:
+            table_name: Table name (without project/dataset prefix)
+            partition_column: Name of the partitioning column
+            partition_values: Partition values (e.g., ['2025-09-01', '2025-10-01'])
+        """
+        if not partition_values:
+            return
+
+        table_id = f"{self.project_id}.{self.dataset}.{table_name}"
+        try:
+            table = self.client.get_table(table_id)
+        except NotFound:
+            logger.info("Table %s does not exist yet, skipping partition deletion", table_name)
+            return
+
+        partitioning = table.time_partitioning
+        if (
+            partitioning is not None
+            and partitioning.type_ == bigquery.TimePartitioningType.MONTH
+            # BigQuery column names are case-insensitive
+            and (partitioning.field or "").casefold() == partition_column.casefold()
+        ):
+            # Metadata lookup: skip months that have no rows to remove
+            nonempty = self.get_nonempty_partitions(table_name)
+            partition_values = [
+                value for value in partition_values
+                if value.replace("-", "")[:6] in nonempty
+            ]
+            if not partition_values:
+                logger.info(
+                    "No existing data in target partitions of %s, skipping deletion",
+                    table_name,
+                )
+                return
+
+            for partition_value in partition_values:
+                self.drop_partition(table_name, partition_value)
+        else:
+            self.delete_partitions(table_name, partition_column, partition_values)
+
+    def get_nonempty_partitions(self, table_name: str) -> set[str]:
+        """
+        List partitions that currently hold rows, from table metadata.
+
+        Reads INFORMATION_SCHEMA.PARTITIONS, which is a metadata query rather
+        than a scan of the table itself.
+
+        Args:
+            table_name: Table name (without project/dataset prefix)
+
+        Returns:
+            Partition IDs with data (e.g., {'202509', '202510'} for monthly)
+        """
+        query = f"""
+        SELECT partition_id
+        FROM `{self.project_id}.{self.dataset}.INFORMATION_SCHEMA.PARTITIONS`
+        WHERE table_name = @table_name AND total_rows > 0
+        """
+        job_config = bigquery.QueryJobConfig(
+            query_parameters=[
+                bigquery.ScalarQueryParameter("table_name", "STRING", table_name),
+            ]
+        )
+        rows = self.client.query(query, job_config=job_config).result()
+        return {row.partition_id for row in rows}
 
     def partition_exists(
         self, table_name: str, partition_column: str, partition_value: str
@@ -62,6 +248,10 @@ class PartitionManager:
         """
         Check if a partition has data.
 
+        When partition_column is the table's time-partitioning column, this is a
+        metadata lookup in INFORMATION_SCHEMA.PARTITIONS. Otherwise it falls back
+        to counting rows in the month.
+
         Args:
             table_name: Table name (without project/dataset prefix)
             partition_column: Name of the partitioning column
@@ -70,17 +260,52 @@ class PartitionManager:
         Returns:
             True if partition exists with data, False otherwise
         """
+        table_id = f"{self.project_id}.{self.dataset}.{table_name}"
+        try:
+            table = self.client.get_table(table_id)
+        except NotFound:
+            return False
+
+        partitioning = table.time_partitioning
+        id_length = _PARTITION_ID_LENGTHS.get(partitioning.type_) if partitioning else None
+        # BigQuery column names are case-insensitive
+        if id_length and (partitioning.field or "").casefold() == partition_column.casefold():
+            query = f"""
+            SELECT 1
+            FROM `{self.project_id}.{self.dataset}.INFORMATION_SCHEMA.PARTITIONS`
+            WHERE table_name = @table_name
+              AND partition_id = @partition_id
+              AND total_rows > 0
+            """
+            job_config = bigquery.QueryJobConfig(
+                query_parameters=[
+                    bigquery.ScalarQueryParameter("table_name", "STRING", table_name),
+                    bigquery.ScalarQueryParameter(
+                        "partition_id",
+                        "STRING",
+                        partition_value.replace("-", "")[:id_length],
+                    ),
+                ]
+            )
+            return self.client.query(query, job_config=job_config).result().total_rows > 0
+
         query = f"""
         SELECT COUNT(*) as count
-        FROM `{self.project_id}.{self.dataset}.{table_name}`
-        WHERE DATE({partition_column}) = '{partition_value}'
+        FROM `{table_id}`
+        WHERE {partition_column} >= TIMESTAMP(@partition_date)
+          AND {partition_column} < TIMESTAMP(DATE_ADD(@partition_date, INTERVAL 1 MONTH))
         """
+        query_job = self.client.query(
+            query, job_config=_partition_date_config(partition_value)
+        )
+        row = next(iter(query_job.result()))
+        return row.count > 0
 
-        try:
-            query_job = self.client.query(query)
-            result = query_job.result()
-            row = next(result)
-            return row.count > 0
-        except Exception:
-            # Table might not exist yet
-            return False
+
+def _partition_date_config(partition_value: str) -> bigquery.QueryJobConfig:
+    """Build a query config binding a monthly partition value as @partition_date."""
+    return bigquery.QueryJobConfig(
+        query_parameters=[
+            bigquery.ScalarQueryParameter("partition_date", "DATE", partition_value),
+        ]
+    )
@@ -1,15 +1,91 @@
 """Manifest discovery and parsing for cloud billing data in GCS buckets."""
 
-import json
+import heapq
+import logging
 import re
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime
+from functools import lru_cache
 from typing import Iterator
 
+from google.api_core.exceptions import Forbidden
 from google.cloud import storage
 
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    # stdlib json also accepts bytes, just parses more slowly
+    from json import loads as _json_loads
 
-@dataclass
+logger = logging.getLogger(__name__)
+
+
+@lru_cache(maxsize=1)
+def _get_storage_client() -> storage.Client:
+    """Return a shared GCS client (thread-safe, reused across discoveries)."""
+    return storage.Client()
+
+
+@lru_cache(maxsize=32)
+def _aws_manifest_pattern(prefix: str, export_name: str) -> re.Pattern:
+    """Compiled pattern for top-level AWS manifests, cached per prefix/export."""
+    # Pattern for top-level manifests: {prefix}/YYYYMMDD-YYYYMMDD/{export_name}-Manifest.json
+    # This matches ONLY the top-level manifest, not versioned subdirectory manifests
+    return re.compile(
+        rf"^{re.escape(prefix.rstrip('/'))}/"
+        r"(\d{8})-(\d{8})/"
+        rf"{re.escape(export_name)}-Manifest\.json$"
+    )
+
+
+# Azure runInfo timestamps: UTC, optional fraction of up to 7 digits, optional "Z"
+_AZURE_TIMESTAMP_RE = re.compile(
+    r"(\d{4})-(\d{2})-(\d{2})T(\d{2}):(\d{2}):(\d{2})(?:\.(\d{1,7}))?Z?"
+)
+
+_RUN_ID_CHARS = frozenset("0123456789abcdef-")
+
+
+def _split_azure_manifest_path(relative_path: str) -> tuple[str, str] | None:
+    """
+    Validate an Azure manifest path relative to {prefix}/{export_name}/.
+
+    Expected layout: YYYYMMDD-YYYYMMDD/YYYYMMDDHHmm/{run_id}/manifest.json,
+    checked segment by segment instead of with a regex.
+
+    Args:
+        relative_path: Blob name with the "{prefix}/{export_name}/" part removed
+
+    Returns:
+        (period start YYYYMMDD, run timestamp YYYYMMDDHHmm), or None if the path
+        is not a run manifest
+    """
+    parts = relative_path.split("/")
+    if len(parts) != 4 or parts[3] != "manifest.json":
+        return None
+    date_range, timestamp, run_id, _ = parts
+    if not (
+        len(date_range) == 17
+        and date_range[8] == "-"
+        and date_range[:8].isdecimal()
+        and date_range[9:].isdecimal()
+        and len(timestamp) == 12
+        and timestamp.isdecimal()
+        and run_id
+        and _RUN_ID_CHARS.issuperset(run_id)
+    ):
+        return None
+    return date_range[:8], timestamp
+
+
+def _fetch_manifest(blob: storage.Blob) -> tuple[storage.Blob, dict]:
+    """Download and parse a single manifest JSON blob."""
+    return blob, _json_loads(blob.download_as_bytes())
+
+
+@dataclass(slots=True)
 class AWSManifest:
     """AWS CUR manifest metadata."""
 
@@ -27,7 +103,7 @@ class AWSManifest:
         return datetime.strptime(self.billing_month, "%Y-%m")
 
 
-@dataclass
+@dataclass(slots=True)
 class AzureManifest:
     """Azure billing manifest metadata."""
 
@@ -46,33 +122,160 @@ class AzureManifest:
     @property
     def submitted_datetime(self) -> datetime:
         """Parse submitted_time as datetime."""
-        # Handle both formats: with and without fractional seconds
-        # "2025-10-16T03:48:05.0084806Z" or "2025-10-16T03:48:05Z"
-        time_str = self.submitted_time.rstrip('Z')
-        if '.' in time_str:
-            # Azure timestamps have 7 decimal places, but Python's %f only handles 6
-            # Truncate to 6 digits
-            parts = time_str.split('.')
-            if len(parts[1]) > 6:
-                time_str = f"{parts[0]}.{parts[1][:6]}"
-            return datetime.strptime(time_str, "%Y-%m-%dT%H:%M:%S.%f")
-        return datetime.strptime(time_str, "%Y-%m-%dT%H:%M:%S")
+        return _parse_azure_timestamp(self.submitted_time)
+
+
+def _parse_azure_timestamp(time_str: str) -> datetime:
+    """Parse an Azure runInfo timestamp as a naive datetime."""
+    # Handles both formats: "2025-10-16T03:48:05.0084806Z" or "2025-10-16T03:48:05Z".
+    # Offsets other than a trailing "Z" are rejected rather than silently dropped
+    match = _AZURE_TIMESTAMP_RE.fullmatch(time_str)
+    if match is None:
+        raise ValueError(f"Unsupported Azure timestamp: {time_str!r}")
+    *fields, fraction = match.groups()
+    # Azure fractions have 7 digits; datetime takes microseconds (6 digits)
+    microsecond = int((fraction or "")[:6].ljust(6, "0"))
+    return datetime(*map(int, fields), microsecond)
+
+
+def _parse_azure_manifest(blob: storage.Blob, manifest_data: dict) -> AzureManifest:
+    """Build an AzureManifest from a downloaded manifest.json."""
+    # Extract billing month from runInfo.startDate
+    start_date = manifest_data["runInfo"]["startDate"]
+    # Format: "2025-10-01T00:00:00" -> "2025-10"
+    billing_month = start_date[:7]
+
+    return AzureManifest(
+        run_id=manifest_data["runInfo"]["runId"],
+        billing_month=billing_month,
+        blobs=manifest_data["blobs"],
+        manifest_path=blob.name,
+        file_format=manifest_data["deliveryConfig"]["fileFormat"],
+        submitted_time=manifest_data["runInfo"]["submittedTime"],
+    )
+
+
+def _cache_azure_metadata(blob: storage.Blob, manifest: AzureManifest) -> bool:
+    """
+    Store the fields needed for the already-loaded check in blob metadata.
+
+    Returns:
+        False if the bucket does not allow metadata writes, True otherwise
+    """
+    blob.metadata = {
+        "run_id": manifest.run_id,
+        "billing_month": manifest.billing_month,
+        "submitted_time": manifest.submitted_time,
+        "file_format": manifest.file_format,
+    }
+    try:
+        blob.patch()
+    except Forbidden as e:
+        # Read-only credentials (e.g. roles/storage.objectViewer) can't patch
+        logger.warning("Cannot cache manifest metadata on %s, skipping: %s", blob.name, e)
+        return False
+    return True
+
+
+# Partial responses for list_blobs: discovery only reads object names (plus
+# custom metadata for cached Azure summaries), so skip the rest of the resource
+_NAME_LIST_FIELDS = "items(name),nextPageToken"
+_SHARD_LIST_FIELDS = "items(name),prefixes,nextPageToken"
+_METADATA_LIST_FIELDS = "items(name,metadata),nextPageToken"
+
+# Custom metadata keys written by _cache_azure_metadata
+_AZURE_METADATA_KEYS = frozenset({"run_id", "billing_month", "submitted_time", "file_format"})
 
 
 class ManifestDiscovery:
     """Discover and parse billing manifest files from GCS buckets."""
 
-    def __init__(self, bucket_name: str):
+    def __init__(
+        self, bucket_name: str, max_workers: int = 16, cache_metadata: bool = False
+    ):
         """
         Initialize manifest discovery.
 
         Args:
             bucket_name: GCS bucket name (without gs:// prefix)
+            max_workers: Max concurrent GCS requests (sharded listing, manifest downloads)
+            cache_metadata: Write manifest summary fields into the manifest object's
+                custom metadata so later runs can skip downloading already-loaded
+                manifests (requires storage.objects.update on the bucket)
         """
-        self.client = storage.Client()
+        self.client = _get_storage_client()
         self.bucket = self.client.bucket(bucket_name)
+        self.max_workers = max_workers
+        self.cache_metadata = cache_metadata
+
+    def _list_sharded(self, prefix: str) -> list[storage.Blob]:
+        """
+        List the top-level blobs of every subdirectory under a prefix concurrently.
+
+        Enumerates the immediate subdirectories with a single delimiter listing,
+        then issues one delimited list_blobs per subdirectory in a thread pool.
+        Falls back to a single-threaded listing when fewer than 2 shards exist.
 
-    def discover_aws_manifests(self, prefix: str, export_name: str) -> Iterator[AWSManifest]:
+        Args:
+            prefix: GCS prefix path (treated as a directory)
+
+        Returns:
+            Blobs found directly inside each subdirectory of the prefix
+        """
+        base = f"{prefix.rstrip('/')}/"
+
+        # Consume the iterator so the `prefixes` set gets populated
+        top_level = self.bucket.list_blobs(
+            prefix=base, delimiter="/", fields=_SHARD_LIST_FIELDS
+        )
+        blobs = list(top_level)
+        shards = sorted(top_level.prefixes)
+
+        def list_shard(shard: str) -> list[storage.Blob]:
+            return list(
+                self.bucket.list_blobs(
+                    prefix=shard, delimiter="/", fields=_SHARD_LIST_FIELDS
+                )
+            )
+
+        if len(shards) < 2:
+            for shard in shards:
+                blobs.extend(list_shard(shard))
+            return blobs
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            for shard_blobs in executor.map(list_shard, shards):
+                blobs.extend(shard_blobs)
+        return blobs
+
+    def _iter_manifests(self, blobs: list[storage.Blob]) -> Iterator[tuple[storage.Blob, dict]]:
+        """
+        Download and parse manifest JSON files concurrently, streaming results.
+
+        Downloads run in parallel, but results are yielded in input order as soon
+        as each one is ready, so callers can start on the first manifest early.
+
+        Args:
+            blobs: Manifest blobs to download
+
+        Yields:
+            (blob, parsed manifest) pairs in the same order as the input
+        """
+        if len(blobs) < 2:
+            yield from map(_fetch_manifest, blobs)
+            return
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            yield from executor.map(_fetch_manifest, blobs)
+
+    def discover_aws_manifests(
+        self,
+        prefix: str,
+        export_name: str,
+        since: str | None = None,
+        until: str | None = None,
+        limit: int | None = None,
+    ) -> Iterator[AWSManifest]:
         """
         Discover AWS CUR v1 manifest files in GCS.
 
@@ -82,115 +285,159 @@ class ManifestDiscovery:
         Each top-level manifest contains the latest assemblyId and reportKeys
         pointing to the current version's files in versioned subdirectories.
 
+        Listing is sharded by date-range directory so each month is listed
+        concurrently rather than walking every object under the prefix.
+        Months outside since/until are filtered on the path, before download.
+
         Args:
             prefix: GCS prefix path (e.g., "gcs-transfer/aws_cur/report-name")
             export_name: AWS CUR export name (e.g., "report-name")
+            since: Earliest billing month to return, inclusive (YYYY-MM)
+            until: Latest billing month to return, inclusive (YYYY-MM)
+            limit: Only return the newest `limit` months (others are never downloaded)
 
         Yields:
             AWSManifest objects sorted by billing period (newest first)
         """
-        # Pattern for top-level manifests: {prefix}/YYYYMMDD-YYYYMMDD/{export_name}-Manifest.json
-        # This matches ONLY the top-level manifest, not versioned subdirectory manifests
-        pattern = re.compile(
-            rf"^{re.escape(prefix.rstrip('/'))}/"
-            r"(\d{8})-(\d{8})/"
-            rf"{re.escape(export_name)}-Manifest\.json$"
-        )
-
-        manifests = []
-        for blob in self.bucket.list_blobs(prefix=prefix):
-            if match := pattern.match(blob.name):
-                manifest_data = json.loads(blob.download_as_text())
-
-                # Extract billing month from billingPeriod.start
-                billing_period_start = manifest_data["billingPeriod"]["start"]
-                # Format: "20250901T000000.000Z" -> "2025-09"
-                billing_month = f"{billing_period_start[:4]}-{billing_period_start[4:6]}"
-
-                manifests.append(
-                    AWSManifest(
-                        assembly_id=manifest_data["assemblyId"],
-                        billing_month=billing_month,
-                        report_keys=manifest_data["reportKeys"],
-                        columns=manifest_data.get("columns", []),
-                        manifest_path=blob.name,
-                        compression=manifest_data.get("compression", "GZIP"),
-                        content_type=manifest_data.get("contentType", "text/csv"),
-                    )
-                )
-
-        # Sort by billing period, newest first
-        manifests.sort(key=lambda m: m.billing_date, reverse=True)
-        yield from manifests
-
-    def discover_azure_manifests(self, prefix: str, export_name: str) -> Iterator[AzureManifest]:
+        pattern = _aws_manifest_pattern(prefix, export_name)
+
+        # First pass: list and filter, second pass: download matches concurrently
+        # Cheap suffix test first - the regex only runs on likely manifests
+        manifest_suffix = f"/{export_name}-Manifest.json"
+        candidates = []
+        for blob in self._list_sharded(prefix):
+            if blob.name.endswith(manifest_suffix) and (match := pattern.match(blob.name)):
+                # Billing month from the date range: "20250901" -> "2025-09"
+                period_start = match.group(1)
+                path_month = f"{period_start[:4]}-{period_start[4:6]}"
+                if (since and path_month < since) or (until and path_month > until):
+                    continue
+                candidates.append((period_start, blob))
+
+        # Sort by billing period start from the path (newest first), so ordering
+        # needs no JSON and manifests can be streamed as downloads complete
+        if limit is None:
+            candidates.sort(key=lambda candidate: candidate[0], reverse=True)
+        else:
+            candidates = heapq.nlargest(limit, candidates, key=lambda candidate: candidate[0])
+        manifest_blobs = [blob for _, blob in candidates]
+
+        for blob, manifest_data in self._iter_manifests(manifest_blobs):
+            # Extract billing month from billingPeriod.start
+            billing_period_start = manifest_data["billingPeriod"]["start"]
+            # Format: "20250901T000000.000Z" -> "2025-09"
+            billing_month = f"{billing_period_start[:4]}-{billing_period_start[4:6]}"
+
+            yield AWSManifest(
+                assembly_id=manifest_data["assemblyId"],
+                billing_month=billing_month,
+                report_keys=manifest_data["reportKeys"],
+                columns=manifest_data.get("columns", []),
+                manifest_path=blob.name,
+                compression=manifest_data.get("compression", "GZIP"),
+                content_type=manifest_data.get("contentType", "text/csv"),
+            )
+
+    def discover_azure_manifests(
+        self,
+        prefix: str,
+        export_name: str,
+        loaded_run_ids: frozenset[str] = frozenset(),
+    ) -> Iterator[AzureManifest]:
         """
         Discover Azure billing manifest files.
 
         Azure path pattern:
         {prefix}/{export_name}/YYYYMMDD-YYYYMMDD/YYYYMMDDHHmm/{run_id}/manifest.json
 
-        For each billing month, returns ONLY the most recent manifest based on
-        runInfo.submittedTime. This handles the case where Azure exports don't
-        delete old versions and multiple manifests exist for the same month.
+        For each billing month, returns ONLY the most recent manifest. This handles
+        the case where Azure exports don't delete old versions and multiple
+        manifests exist for the same month. The newest run is picked from the
+        path alone (billing month from the date range, recency from the
+        YYYYMMDDHHmm run directory), so superseded manifests are never downloaded.
+
+        With cache_metadata enabled, a selected manifest whose cached run_id is
+        in loaded_run_ids is built from object metadata (returned by the
+        listing) instead of being downloaded; its blobs list is empty.
 
         Args:
             prefix: GCS prefix path
             export_name: Azure export name
+            loaded_run_ids: Run IDs already loaded (only used with cache_metadata)
 
         Yields:
             AzureManifest objects sorted by billing period (newest first),
             with only the most recent manifest per month
         """
-        # Pattern: gcs-transfer/azure/billingdata/{export-name}/
-        #          20251001-20251031/202510210349/aa7e.../manifest.json
-        pattern = re.compile(
-            rf"^{re.escape(prefix)}/{re.escape(export_name)}/"
-            r"(\d{8})-(\d{8})/"  # date range
-            r"\d{12}/"  # timestamp (YYYYMMDDHHmm)
-            r"[a-f0-9\-]+/"  # run_id (UUID)
-            r"manifest\.json$"
+        base = f"{prefix}/{export_name}/"
+
+        # First pass: list and select, second pass: download winners concurrently
+        # match_glob filters server-side so Parquet parts never leave GCS;
+        # the structural path check only validates the remaining candidates
+        listing = self.bucket.list_blobs(
+            prefix=base,
+            match_glob=f"{prefix}/{export_name}/*/*/*/manifest.json",
+            # Cached summaries live in custom metadata, so only request it when used
+            fields=_METADATA_LIST_FIELDS if self.cache_metadata else _NAME_LIST_FIELDS,
         )
 
-        all_manifests = []
-        for blob in self.bucket.list_blobs(prefix=f"{prefix}/{export_name}/"):
-            if pattern.match(blob.name):
-                manifest_data = json.loads(blob.download_as_text())
-
-                # Extract billing month from runInfo.startDate
-                start_date = manifest_data["runInfo"]["startDate"]
-                # Format: "2025-10-01T00:00:00" -> "2025-10"
-                billing_month = start_date[:7]
-
-                all_manifests.append(
-                    AzureManifest(
-                        run_id=manifest_data["runInfo"]["runId"],
-                        billing_month=billing_month,
-                        blobs=manifest_data["blobs"],
-                        manifest_path=blob.name,
-                        file_format=manifest_data["deliveryConfig"]["fileFormat"],
-                        submitted_time=manifest_data["runInfo"]["submittedTime"],
-                    )
+        # Keep the newest run directory per billing month: {month: (timestamp, blob)}
+        latest = {}
+        skipped = Counter()
+        for blob in listing:
+            if not blob.name.startswith(base):
+                continue
+            path_parts = _split_azure_manifest_path(blob.name[len(base):])
+            if path_parts is None:
+                continue
+
+            # Date range "20251001-20251031" -> "2025-10"
+            start_date, timestamp = path_parts
+            billing_month = f"{start_date[:4]}-{start_date[4:6]}"
+
+            current = latest.get(billing_month)
+            if current is None:
+                latest[billing_month] = (timestamp, blob)
+                continue
+            skipped[billing_month] += 1
+            if (timestamp, blob.name) > (current[0], current[1].name):
+                latest[billing_month] = (timestamp, blob)
+
+        manifests = {}
+        to_download = {}
+        for billing_month, (_, blob) in latest.items():
+            # Listings include custom metadata, so no extra request is needed here
+            cached = (blob.metadata or {}) if self.cache_metadata else {}
+            if _AZURE_METADATA_KEYS <= cached.keys() and cached["run_id"] in loaded_run_ids:
+                manifests[billing_month] = AzureManifest(
+                    run_id=cached["run_id"],
+                    billing_month=cached["billing_month"],
+                    blobs=[],
+                    manifest_path=blob.name,
+                    file_format=cached["file_format"],
+                    submitted_time=cached["submitted_time"],
                 )
-
-        # Group by billing month and select most recent per month
-        from itertools import groupby
-
-        # Sort by billing month (newest first), then by submitted time (newest first)
-        all_manifests.sort(
-            key=lambda m: (m.billing_date, m.submitted_datetime),
-            reverse=True
-        )
-
-        # Group by billing month and take the first (most recent) from each group
-        manifests = []
-        for billing_month, group in groupby(all_manifests, key=lambda m: m.billing_month):
-            most_recent = next(group)  # First item is most recent due to sorting
-            manifests.append(most_recent)
-
-            # Log skipped manifests for visibility
-            skipped = list(group)
-            if skipped:
-                print(f"  Found {len(skipped)} older manifest(s) for {billing_month}, using most recent (submitted: {most_recent.submitted_time})")
-
-        yield from manifests
+            else:
+                to_download[blob.name] = billing_month
+
+        download_blobs = [latest[billing_month][1] for billing_month in to_download.values()]
+        # Stop writing metadata for the rest of the run once a write is refused
+        write_cache = self.cache_metadata
+        for blob, manifest_data in self._iter_manifests(download_blobs):
+            manifest = _parse_azure_manifest(blob, manifest_data)
+            manifests[to_download[blob.name]] = manifest
+            if write_cache and (blob.metadata or {}).get("run_id") != manifest.run_id:
+                write_cache = _cache_azure_metadata(blob, manifest)
+
+        # Log skipped manifests for visibility
+        for billing_month, count in skipped.items():
+            logger.info(
+                "Found %d older manifest(s) for %s, using most recent (submitted: %s)",
+                count,
+                billing_month,
+                manifests[billing_month].submitted_time,
+            )
+
+        # Sort by billing month (newest first)
+        for billing_month in sorted(manifests, reverse=True):
+            yield manifests[billing_month]
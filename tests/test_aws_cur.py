@@ -0,0 +1,79 @@
+"""Tests for AWS CUR URI and schema building."""
+
+import pytest
+
+from pipelines.aws_cur import (
+    _build_bigquery_schema,
+    _build_csv_gcs_uris,
+    _build_parquet_gcs_uris,
+)
+from pipelines.common.manifest import AWSManifest
+
+PREFIX = "gcs-transfer/aws/CUR/account"
+
+
+@pytest.fixture
+def csv_manifest():
+    return AWSManifest(
+        assembly_id="20251102T123456Z",
+        billing_month="2025-11",
+        report_keys=[
+            "CUR/account/20251101-20251201/20251102T123456Z/account-00001.csv.gz",
+            "CUR/account/20251101-20251201/20251102T123456Z/account-00002.csv.gz",
+        ],
+        columns=[
+            {"category": "identity", "name": "LineItemId", "type": "String"},
+            {"category": "bill", "name": "BillingPeriodStartDate", "type": "DateTime"},
+            {"category": "lineItem", "name": "UnblendedCost", "type": "BigDecimal"},
+            {"category": "resourceTags", "name": "user:Name", "type": "OptionalString"},
+            {"category": "resourceTags", "name": "user_Name", "type": "OptionalString"},
+            {"category": "product", "name": "group", "type": "Unknown"},
+        ],
+        manifest_path=f"{PREFIX}/20251101-20251201/account-Manifest.json",
+        compression="GZIP",
+        content_type="text/csv",
+    )
+
+
+@pytest.fixture
+def parquet_manifest():
+    return AWSManifest(
+        assembly_id="20251102T123456Z",
+        billing_month="2025-11",
+        report_keys=[
+            "billing/cur/export/export/year=2025/month=11/export-00001.snappy.parquet",
+            "billing/cur/export/export/year=2025/month=11/export-00002.snappy.parquet",
+        ],
+        columns=[],
+        manifest_path=f"{PREFIX}/20251101-20251201/export-Manifest.json",
+        compression="Parquet",
+        content_type="Parquet",
+    )
+
+
+def test_csv_gcs_uris(csv_manifest):
+    assert _build_csv_gcs_uris("bucket", csv_manifest) == [
+        f"gs://bucket/{PREFIX}/20251101-20251201/20251102T123456Z/account-00001.csv.gz",
+        f"gs://bucket/{PREFIX}/20251101-20251201/20251102T123456Z/account-00002.csv.gz",
+    ]
+
+
+def test_parquet_gcs_uris(parquet_manifest):
+    assert _build_parquet_gcs_uris("bucket", parquet_manifest) == [
+        f"gs://bucket/{PREFIX}/export/year=2025/month=11/export-00001.snappy.parquet",
+        f"gs://bucket/{PREFIX}/export/year=2025/month=11/export-00002.snappy.parquet",
+    ]
+
+
+def test_bigquery_schema(csv_manifest):
+    schema = _build_bigquery_schema(csv_manifest)
+    assert [(field.name, field.field_type, field.mode) for field in schema] == [
+        ("identity_line_item_id", "STRING", "NULLABLE"),
+        ("bill_billing_period_start_date", "TIMESTAMP", "NULLABLE"),
+        ("line_item_unblended_cost", "BIGNUMERIC", "NULLABLE"),
+        ("resource_tags_user_name", "STRING", "NULLABLE"),
+        # Duplicate after normalization gets a numeric suffix
+        ("resource_tags_user_name_1", "STRING", "NULLABLE"),
+        # Unknown AWS types fall back to STRING
+        ("product_group", "STRING", "NULLABLE"),
+    ]
@@ -0,0 +1,76 @@
+"""Tests for Azure manifest path validation and timestamp parsing."""
+
+from datetime import datetime
+
+import pytest
+
+from pipelines.common.manifest import _parse_azure_timestamp, _split_azure_manifest_path
+
+
+def test_valid_manifest_path():
+    path = "20251001-20251031/202510210349/aa7e0c1d-12ab-4f00-9e3b-0123456789ab/manifest.json"
+    assert _split_azure_manifest_path(path) == ("20251001", "202510210349")
+
+
+@pytest.mark.parametrize(
+    "path",
+    [
+        # Wrong segment lengths
+        "20251001-2025103/202510210349/aa7e/manifest.json",
+        "2025100-20251031/202510210349/aa7e/manifest.json",
+        "20251001-20251031/20251021034/aa7e/manifest.json",
+        "20251001-20251031/2025102103490/aa7e/manifest.json",
+        # Non-digits
+        "2025100a-20251031/202510210349/aa7e/manifest.json",
+        "20251001-2025103x/202510210349/aa7e/manifest.json",
+        "20251001-20251031/20251021034x/aa7e/manifest.json",
+        "20251001_20251031/202510210349/aa7e/manifest.json",
+        # Uppercase or non-hex run IDs
+        "20251001-20251031/202510210349/AA7E/manifest.json",
+        "20251001-20251031/202510210349/g1/manifest.json",
+        # Extra or empty segments
+        "20251001-20251031/202510210349/aa7e/extra/manifest.json",
+        "extra/20251001-20251031/202510210349/aa7e/manifest.json",
+        "20251001-20251031/202510210349//manifest.json",
+        "20251001-20251031//aa7e/manifest.json",
+        # Wrong filename
+        "20251001-20251031/202510210349/aa7e/manifest.jsonx",
+        "20251001-20251031/202510210349/aa7e/Manifest.json",
+        "20251001-20251031/202510210349/aa7e/part_0.snappy.parquet",
+    ],
+)
+def test_invalid_manifest_path(path):
+    assert _split_azure_manifest_path(path) is None
+
+
+@pytest.mark.parametrize(
+    ("time_str", "expected"),
+    [
+        # Azure's 7-digit fraction is truncated to microseconds
+        ("2025-10-16T03:48:05.0084806Z", datetime(2025, 10, 16, 3, 48, 5, 8480)),
+        # Short fractions are right-padded
+        ("2025-10-16T03:48:05.12Z", datetime(2025, 10, 16, 3, 48, 5, 120000)),
+        ("2025-10-16T03:48:05.5", datetime(2025, 10, 16, 3, 48, 5, 500000)),
+        # No fraction
+        ("2025-10-16T03:48:05Z", datetime(2025, 10, 16, 3, 48, 5)),
+        ("2025-10-16T03:48:05", datetime(2025, 10, 16, 3, 48, 5)),
+    ],
+)
+def test_parse_azure_timestamp(time_str, expected):
+    assert _parse_azure_timestamp(time_str) == expected
+
+
+@pytest.mark.parametrize(
+    "time_str",
+    [
+        "2025-10-16T03:48:05+00:00",
+        "2025-10-16T03:48:05.0084806+02:00",
+        "2025-10-16T03:48:05.00848061Z",
+        "2025-10-16T03:48:05.Z",
+        "2025-10-16 03:48:05Z",
+        "2025-10-16",
+    ],
+)
+def test_parse_azure_timestamp_rejects_other_formats(time_str):
+    with pytest.raises(ValueError):
+        _parse_azure_timestamp(time_str)